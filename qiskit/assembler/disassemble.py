@@ -12,12 +12,17 @@
 
 """Disassemble function for a qobj into a list of circuits and its config"""
 from typing import Any, Dict, List, NewType, Tuple, Union
-import collections
+import functools
+import itertools
 import math
+import operator
 
 from qiskit import pulse
 from qiskit.circuit.classicalregister import ClassicalRegister
 from qiskit.circuit.instruction import Instruction
+from qiskit.circuit.library import standard_gates
+from qiskit.circuit.measure import Measure
+from qiskit.circuit.reset import Reset
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.quantumregister import QuantumRegister
 
@@ -36,6 +41,56 @@ CircuitModule = NewType(
 # and a header dictionary.
 PulseModule = NewType("PulseModule", Tuple[List[pulse.Schedule], Dict[str, Any], Dict[str, Any]])
 
+# Instructions whose ``QuantumCircuit`` convenience method only constructs the instruction from its
+# parameters and appends it to the given bits. These are built directly and appended through the
+# circuit's internal fast path, skipping the argument conversion and broadcasting of the method.
+_STANDARD_INSTRUCTIONS = {
+    "measure": Measure,
+    "reset": Reset,
+    "id": standard_gates.IGate,
+    "x": standard_gates.XGate,
+    "y": standard_gates.YGate,
+    "z": standard_gates.ZGate,
+    "h": standard_gates.HGate,
+    "s": standard_gates.SGate,
+    "sdg": standard_gates.SdgGate,
+    "t": standard_gates.TGate,
+    "tdg": standard_gates.TdgGate,
+    "sx": standard_gates.SXGate,
+    "sxdg": standard_gates.SXdgGate,
+    "rx": standard_gates.RXGate,
+    "ry": standard_gates.RYGate,
+    "rz": standard_gates.RZGate,
+    "r": standard_gates.RGate,
+    "p": standard_gates.PhaseGate,
+    "u": standard_gates.UGate,
+    "u1": standard_gates.U1Gate,
+    "u2": standard_gates.U2Gate,
+    "u3": standard_gates.U3Gate,
+    "cx": standard_gates.CXGate,
+    "cy": standard_gates.CYGate,
+    "cz": standard_gates.CZGate,
+    "ch": standard_gates.CHGate,
+    "csx": standard_gates.CSXGate,
+    "crx": standard_gates.CRXGate,
+    "cry": standard_gates.CRYGate,
+    "crz": standard_gates.CRZGate,
+    "cp": standard_gates.CPhaseGate,
+    "cu": standard_gates.CUGate,
+    "cu1": standard_gates.CU1Gate,
+    "cu3": standard_gates.CU3Gate,
+    "swap": standard_gates.SwapGate,
+    "iswap": standard_gates.iSwapGate,
+    "dcx": standard_gates.DCXGate,
+    "ecr": standard_gates.ECRGate,
+    "rxx": standard_gates.RXXGate,
+    "ryy": standard_gates.RYYGate,
+    "rzz": standard_gates.RZZGate,
+    "rzx": standard_gates.RZXGate,
+    "ccx": standard_gates.CCXGate,
+    "cswap": standard_gates.CSwapGate,
+}
+
 
 def disassemble(qobj) -> Union[CircuitModule, PulseModule]:
     """Disassemble a qobj and return the circuits or pulse schedules, run_config, and user header.
@@ -82,28 +137,60 @@ def _disassemble_circuit(qobj) -> CircuitModule:
 
 def _qobj_to_circuit_cals(qobj, pulse_lib, param_pulses):
     """Return circuit calibrations dictionary from qobj/exp config calibrations."""
-    qobj_cals = qobj.config.calibrations.to_dict()["gates"]
+    return _gate_cals_to_circuit_cals(_parse_gate_cals(qobj, param_pulses), pulse_lib)
+
+
+def _parse_gate_cals(qobj, param_pulses):
+    """Return the gate calibrations of a qobj/exp config with their instructions parsed.
+
+    Args:
+        qobj (Qobj or QobjExperiment): The qobj or experiment whose config holds calibrations.
+        param_pulses (list): The parametric pulse shapes supported by the qobj.
+
+    Returns:
+        list: A ``(name, qubits, params, instructions)`` tuple for each gate calibration, with
+        each instruction paired with whether it is converted as a parametric pulse.
+    """
+    return [
+        (
+            gate["name"],
+            gate["qubits"],
+            gate["params"],
+            [
+                (
+                    PulseQobjInstruction.from_dict(instruction),
+                    "pulse_shape" in instruction and instruction["pulse_shape"] in param_pulses,
+                )
+                for instruction in gate["instructions"]
+            ],
+        )
+        for gate in qobj.config.calibrations.to_dict()["gates"]
+    ]
+
+
+def _gate_cals_to_circuit_cals(gate_cals, pulse_lib):
+    """Return circuit calibrations dictionary from parsed gate calibrations.
+
+    New schedules are built on every call, so the returned calibrations share no mutable objects
+    with those of other calls.
+    """
     converter = QobjToInstructionConverter(pulse_lib)
 
     qc_cals = {}
-    for gate in qobj_cals:
-        config = (tuple(gate["qubits"]), tuple(gate["params"]))
-        cal = {
-            config: pulse.Schedule(
-                name="{} {} {}".format(gate["name"], str(gate["params"]), str(gate["qubits"]))
-            )
-        }
-        for instruction in gate["instructions"]:
+    for name, qubits, params, instructions in gate_cals:
+        config = (tuple(qubits), tuple(params))
+        cal = {config: pulse.Schedule(name="{} {} {}".format(name, str(params), str(qubits)))}
+        for instruction, is_parametric in instructions:
             schedule = (
-                converter.convert_parametric(PulseQobjInstruction.from_dict(instruction))
-                if "pulse_shape" in instruction and instruction["pulse_shape"] in param_pulses
-                else converter(PulseQobjInstruction.from_dict(instruction))
+                converter.convert_parametric(instruction)
+                if is_parametric
+                else converter(instruction)
             )
             cal[config] = cal[config].insert(schedule.ch_start_time(), schedule)
-        if gate["name"] in qc_cals:
-            qc_cals[gate["name"]].update(cal)
+        if name in qc_cals:
+            qc_cals[name].update(cal)
         else:
-            qc_cals[gate["name"]] = cal
+            qc_cals[name] = cal
 
     return qc_cals
 
@@ -120,119 +207,260 @@ def _experiments_to_circuits(qobj):
     if not qobj.experiments:
         return None
 
-    circuits = []
-    for exp in qobj.experiments:
-        quantum_registers = [QuantumRegister(i[1], name=i[0]) for i in exp.header.qreg_sizes]
-        classical_registers = [ClassicalRegister(i[1], name=i[0]) for i in exp.header.creg_sizes]
-        circuit = QuantumCircuit(*quantum_registers, *classical_registers, name=exp.header.name)
-        qreg_dict = collections.OrderedDict()
-        creg_dict = collections.OrderedDict()
-        for reg in quantum_registers:
-            qreg_dict[reg.name] = reg
-        for reg in classical_registers:
-            creg_dict[reg.name] = reg
-        conditional = {}
-        for i in exp.instructions:
-            name = i.name
-            qubits = []
-            params = getattr(i, "params", [])
-            try:
-                for qubit in i.qubits:
-                    qubit_label = exp.header.qubit_labels[qubit]
-                    qubits.append(qreg_dict[qubit_label[0]][qubit_label[1]])
-            except Exception:  # pylint: disable=broad-except
-                pass
-            clbits = []
-            try:
-                for clbit in i.memory:
-                    clbit_label = exp.header.clbit_labels[clbit]
-                    clbits.append(creg_dict[clbit_label[0]][clbit_label[1]])
-            except Exception:  # pylint: disable=broad-except
-                pass
-            if hasattr(circuit, name):
-                instr_method = getattr(circuit, name)
-                if i.name in ["snapshot"]:
-                    _inst = instr_method(
-                        i.label, snapshot_type=i.snapshot_type, qubits=qubits, params=params
-                    )
-                elif i.name == "initialize":
-                    _inst = instr_method(params, qubits)
-                elif i.name == "isometry":
-                    _inst = instr_method(*params, qubits, clbits)
-                elif i.name in ["mcx", "mcu1", "mcp"]:
-                    _inst = instr_method(*params, qubits[:-1], qubits[-1], *clbits)
-                else:
-                    _inst = instr_method(*params, *qubits, *clbits)
-            elif name == "bfunc":
-                conditional["value"] = int(i.val, 16)
-                full_bit_size = sum(creg_dict[x].size for x in creg_dict)
-                mask_map = {}
-                raw_map = {}
-                raw = []
-
-                for creg in creg_dict:
-                    size = creg_dict[creg].size
-                    reg_raw = [1] * size
-                    if not raw:
-                        raw = reg_raw
-                    else:
-                        for pos, val in enumerate(raw):
-                            if val == 1:
-                                raw[pos] = 0
-                        raw = reg_raw + raw
-                    mask = [0] * (full_bit_size - len(raw)) + raw
-                    raw_map[creg] = mask
-                    mask_map[int("".join(str(x) for x in mask), 2)] = creg
-                if bin(int(i.mask, 16)).count("1") == 1:
-                    # The condition is on a single bit.  This might be a single-bit condition, or it
-                    # might be a register of length one.  The case that it's a single-bit condition
-                    # in a register of length one is ambiguous, and we choose to return a condition
-                    # on the register.  This may not match the input circuit exactly, but is at
-                    # least equivalent.
-                    cbit = int(math.log2(int(i.mask, 16)))
-                    for reg in creg_dict.values():
-                        size = reg.size
-                        if cbit >= size:
-                            cbit -= size
-                        else:
-                            conditional["register"] = reg if reg.size == 1 else reg[cbit]
-                            break
-                    mask_str = bin(int(i.mask, 16))[2:].zfill(full_bit_size)
-                    mask = [int(item) for item in list(mask_str)]
-                else:
-                    creg = mask_map[int(i.mask, 16)]
-                    conditional["register"] = creg_dict[creg]
-                    mask = raw_map[creg]
-                val = int(i.val, 16)
-                for j in reversed(mask):
-                    if j == 0:
-                        val = val >> 1
-                    else:
-                        conditional["value"] = val
-                        break
-            else:
-                _inst = temp_opaque_instruction = Instruction(
-                    name=name, num_qubits=len(qubits), num_clbits=len(clbits), params=params
-                )
-                circuit.append(temp_opaque_instruction, qubits, clbits)
-            if conditional and name != "bfunc":
-                _inst.c_if(conditional["register"], conditional["value"])
-                conditional = {}
-        pulse_lib = qobj.config.pulse_library if hasattr(qobj.config, "pulse_library") else []
-        parametric_pulses = (
-            qobj.config.parametric_pulses if hasattr(qobj.config, "parametric_pulses") else []
-        )
-        # The dict update method did not work here; could investigate in the future
-        if hasattr(qobj.config, "calibrations"):
-            circuit.calibrations = dict(
-                **circuit.calibrations, **_qobj_to_circuit_cals(qobj, pulse_lib, parametric_pulses)
-            )
-        if hasattr(exp.config, "calibrations"):
-            circuit.calibrations = dict(
-                **circuit.calibrations, **_qobj_to_circuit_cals(exp, pulse_lib, parametric_pulses)
+    pulse_lib = qobj.config.pulse_library if hasattr(qobj.config, "pulse_library") else []
+    parametric_pulses = (
+        qobj.config.parametric_pulses if hasattr(qobj.config, "parametric_pulses") else []
+    )
+    # Calibrations common to all experiments are stored once at the qobj level, so parse them a
+    # single time. Their schedules are still built for each circuit, as circuits must not share
+    # mutable calibration schedules.
+    if hasattr(qobj.config, "calibrations"):
+        qobj_gate_cals = _parse_gate_cals(qobj, parametric_pulses)
+    else:
+        qobj_gate_cals = []
+
+    # Batched experiments are commonly generated with the same registers, so their registers and
+    # bit tables are built once per distinct layout and shared between the circuits.
+    layouts = {}
+    return [
+        _experiment_to_circuit(exp, layouts, qobj_gate_cals, pulse_lib, parametric_pulses)
+        for exp in qobj.experiments
+    ]
+
+
+def _experiment_to_circuit(exp, layouts, qobj_gate_cals, pulse_lib, parametric_pulses):
+    """Return the QuantumCircuit described by a single qobj experiment.
+
+    Args:
+        exp (QasmQobjExperiment): The experiment to convert.
+        layouts (dict): Cache of the register layouts built for previous experiments, updated in
+            place.
+        qobj_gate_cals (list): Gate calibrations parsed from the qobj-level config.
+        pulse_lib (list): The pulse library of the qobj.
+        parametric_pulses (list): The parametric pulse shapes supported by the qobj.
+
+    Returns:
+        QuantumCircuit: The circuit of the experiment.
+    """
+    header = exp.header
+    qubit_labels = getattr(header, "qubit_labels", [])
+    clbit_labels = getattr(header, "clbit_labels", [])
+    layout_key = (
+        tuple(map(tuple, header.qreg_sizes)),
+        tuple(map(tuple, header.creg_sizes)),
+        tuple(map(tuple, qubit_labels)),
+        tuple(map(tuple, clbit_labels)),
+    )
+    layout = layouts.get(layout_key)
+    if layout is None:
+        layout = layouts[layout_key] = _build_layout(header, qubit_labels, clbit_labels)
+    quantum_registers, classical_registers, qubit_bits, clbit_bits = layout
+    circuit = QuantumCircuit(*quantum_registers, *classical_registers, name=header.name)
+    creg_dict = {reg.name: reg for reg in classical_registers}
+    # Resolve the circuit method for each distinct instruction name once per experiment,
+    # instead of repeating the attribute lookup for every instruction.
+    instr_methods = {
+        name: getattr(circuit, name, None) for name in {i.name for i in exp.instructions}
+    }
+    conditional = {}
+    # Consecutive instructions frequently share a name (e.g. layers of the same gate), so
+    # walk the instructions in runs and resolve the circuit method once per run. The
+    # instructions cannot be bucketed globally by name, as that would reorder the circuit.
+    # The calling convention of the circuit method is also chosen once per run.
+    get_qubit = qubit_bits.__getitem__
+    get_clbit = clbit_bits.__getitem__
+    for name, run in itertools.groupby(exp.instructions, key=operator.attrgetter("name")):
+        if name == "bfunc":
+            # A bfunc only conditions the instruction directly following it.
+            for i in run:
+                conditional = _bfunc_to_conditional(i, creg_dict)
+            continue
+        instr_method = instr_methods[name]
+        if instr_method is None:
+            appender = functools.partial(_append_opaque, circuit)
+        elif name in _STANDARD_INSTRUCTIONS:
+            appender = functools.partial(
+                _append_standard_instruction, circuit, _STANDARD_INSTRUCTIONS[name]
             )
-        circuits.append(circuit)
-    return circuits
+        else:
+            appender = _SPECIAL_APPENDERS.get(name, _append_gate)
+        if conditional:
+            # Peel off the conditioned instruction, so that the loop over the rest of the run
+            # only appends.
+            i = next(run)
+            qubits = list(map(get_qubit, getattr(i, "qubits", [])))
+            clbits = list(map(get_clbit, getattr(i, "memory", [])))
+            _inst = appender(instr_method, i, getattr(i, "params", []), qubits, clbits)
+            _inst.c_if(conditional["register"], conditional["value"])
+            conditional = {}
+        for i in run:
+            qubits = list(map(get_qubit, getattr(i, "qubits", [])))
+            clbits = list(map(get_clbit, getattr(i, "memory", [])))
+            appender(instr_method, i, getattr(i, "params", []), qubits, clbits)
+    # The dict update method did not work here; could investigate in the future
+    if qobj_gate_cals:
+        circuit.calibrations = dict(
+            **circuit.calibrations, **_gate_cals_to_circuit_cals(qobj_gate_cals, pulse_lib)
+        )
+    if hasattr(exp.config, "calibrations"):
+        circuit.calibrations = dict(
+            **circuit.calibrations, **_qobj_to_circuit_cals(exp, pulse_lib, parametric_pulses)
+        )
+    return circuit
+
+
+def _build_layout(header, qubit_labels, clbit_labels):
+    """Return the registers of an experiment header and the bits addressed by its labels.
+
+    Args:
+        header (QobjExperimentHeader): The experiment header.
+        qubit_labels (list): The ``[register name, index]`` label of each qubit.
+        clbit_labels (list): The ``[register name, index]`` label of each clbit.
+
+    Returns:
+        tuple: The quantum registers, the classical registers, and tuples of the qubits and clbits
+        in label order.
+    """
+    quantum_registers = [
+        QuantumRegister(size, name=reg_name) for reg_name, size in header.qreg_sizes
+    ]
+    classical_registers = [
+        ClassicalRegister(size, name=reg_name) for reg_name, size in header.creg_sizes
+    ]
+    # Map each label index to its bit once rather than resolving the register and index for
+    # every instruction argument. The labels index plain lists of each register's bits, which
+    # avoids the key validation done by indexing the register itself.
+    qreg_bits = {reg.name: reg[:] for reg in quantum_registers}
+    creg_bits = {reg.name: reg[:] for reg in classical_registers}
+    qubit_bits = tuple(qreg_bits[reg_name][index] for reg_name, index in qubit_labels)
+    clbit_bits = tuple(creg_bits[reg_name][index] for reg_name, index in clbit_labels)
+    return quantum_registers, classical_registers, qubit_bits, clbit_bits
+
+
+# The functions below append the qobj instruction ``instruction`` with the resolved arguments,
+# usually by calling the ``QuantumCircuit`` method ``instr_method`` matching its name. They share a
+# common signature so that the calling convention can be selected once per run of equally named
+# instructions.
+# pylint: disable=unused-argument
+
+
+def _append_snapshot(instr_method, instruction, params, qubits, clbits):
+    return instr_method(
+        instruction.label, snapshot_type=instruction.snapshot_type, qubits=qubits, params=params
+    )
+
+
+def _append_initialize(instr_method, instruction, params, qubits, clbits):
+    return instr_method(params, qubits)
+
+
+def _append_isometry(instr_method, instruction, params, qubits, clbits):
+    return instr_method(*params, qubits, clbits)
+
+
+def _append_multi_controlled(instr_method, instruction, params, qubits, clbits):
+    return instr_method(*params, qubits[:-1], qubits[-1], *clbits)
+
+
+def _append_gate(instr_method, instruction, params, qubits, clbits):
+    return instr_method(*params, *qubits, *clbits)
+
+
+def _append_opaque(circuit, instr_method, instruction, params, qubits, clbits):
+    opaque_instruction = Instruction(
+        name=instruction.name, num_qubits=len(qubits), num_clbits=len(clbits), params=params
+    )
+    circuit.append(opaque_instruction, qubits, clbits)
+    return opaque_instruction
+
+
+def _append_standard_instruction(
+    circuit, instr_class, instr_method, instruction, params, qubits, clbits
+):
+    operation = instr_class(*params)
+    if (
+        operation.num_qubits != len(qubits)
+        or operation.num_clbits != len(clbits)
+        or len(set(qubits)) != len(qubits)
+        or len(set(clbits)) != len(clbits)
+    ):
+        # Leave broadcasting and error reporting for unexpected or duplicate arguments to the
+        # public method.
+        return instr_method(*params, *qubits, *clbits)
+    return circuit._append(operation, qubits, clbits)
+
+
+# pylint: enable=unused-argument
+
+# Instructions whose circuit method does not take the instruction parameters and bits as plain
+# positional arguments. Any other instruction with a circuit method is appended by ``_append_gate``.
+_SPECIAL_APPENDERS = {
+    "snapshot": _append_snapshot,
+    "initialize": _append_initialize,
+    "isometry": _append_isometry,
+    "mcx": _append_multi_controlled,
+    "mcu1": _append_multi_controlled,
+    "mcp": _append_multi_controlled,
+}
+
+
+def _bfunc_to_conditional(instruction, creg_dict):
+    """Return the circuit condition encoded by a qobj ``bfunc`` instruction.
+
+    Args:
+        instruction (QasmQobjInstruction): The ``bfunc`` instruction.
+        creg_dict (dict): The classical registers of the experiment keyed by name, in order.
+
+    Returns:
+        dict: The ``register`` and ``value`` of the condition to apply to the next instruction.
+    """
+    conditional = {"value": int(instruction.val, 16)}
+    full_bit_size = sum(creg_dict[x].size for x in creg_dict)
+    mask_map = {}
+    raw_map = {}
+    raw = []
+
+    for creg in creg_dict:
+        size = creg_dict[creg].size
+        reg_raw = [1] * size
+        if not raw:
+            raw = reg_raw
+        else:
+            for pos, val in enumerate(raw):
+                if val == 1:
+                    raw[pos] = 0
+            raw = reg_raw + raw
+        mask = [0] * (full_bit_size - len(raw)) + raw
+        raw_map[creg] = mask
+        mask_map[int("".join(str(x) for x in mask), 2)] = creg
+    if bin(int(instruction.mask, 16)).count("1") == 1:
+        # The condition is on a single bit.  This might be a single-bit condition, or it
+        # might be a register of length one.  The case that it's a single-bit condition
+        # in a register of length one is ambiguous, and we choose to return a condition
+        # on the register.  This may not match the input circuit exactly, but is at
+        # least equivalent.
+        cbit = int(math.log2(int(instruction.mask, 16)))
+        for reg in creg_dict.values():
+            size = reg.size
+            if cbit >= size:
+                cbit -= size
+            else:
+                conditional["register"] = reg if reg.size == 1 else reg[cbit]
+                break
+        mask_str = bin(int(instruction.mask, 16))[2:].zfill(full_bit_size)
+        mask = [int(item) for item in list(mask_str)]
+    else:
+        creg = mask_map[int(instruction.mask, 16)]
+        conditional["register"] = creg_dict[creg]
+        mask = raw_map[creg]
+    val = int(instruction.val, 16)
+    for j in reversed(mask):
+        if j == 0:
+            val = val >> 1
+        else:
+            conditional["value"] = val
+            break
+    return conditional
 
 
 def _disassemble_pulse_schedule(qobj) -> PulseModule:
@@ -1332,11 +1332,12 @@ class QuantumCircuit:
                     " with %s." % (regs,)
                 )
 
+        register_names = {reg.name for reg in itertools.chain(self.qregs, self.cregs)}
         for register in regs:
-            if isinstance(register, Register) and any(
-                register.name == reg.name for reg in self.qregs + self.cregs
-            ):
-                raise CircuitError('register name "%s" already exists' % register.name)
+            if isinstance(register, Register):
+                if register.name in register_names:
+                    raise CircuitError('register name "%s" already exists' % register.name)
+                register_names.add(register.name)
 
             if isinstance(register, AncillaRegister):
                 for bit in register:
@@ -86,6 +86,11 @@ class NodeVisitor:
     outside of the Qiskit Pulse module.
     """
 
+    # Name of the visitor method for each pair of visitor class and node class, shared by all
+    # visitor instances. A new visitor is created for every node inserted into a program,
+    # so resolving the method through the superclasses each time would be wasteful.
+    _visitor_names = {}
+
     def visit(self, node: Any):
         """Visit a node."""
         visitor = self._get_visitor(type(node))
@@ -93,14 +98,22 @@ class NodeVisitor:
 
     def _get_visitor(self, node_class):
         """A helper function to recursively investigate superclass visitor method."""
-        if node_class == object:
-            return self.generic_visit
-
+        key = (type(self), node_class)
         try:
-            return getattr(self, f"visit_{node_class.__name__}")
-        except AttributeError:
+            name = self._visitor_names[key]
+        except KeyError:
+            name = self._visitor_names[key] = self._find_visitor_name(node_class)
+        return getattr(self, name)
+
+    def _find_visitor_name(self, node_class):
+        """A helper function to find the name of the visitor method for a node class."""
+        while node_class != object:
+            name = f"visit_{node_class.__name__}"
+            if hasattr(self, name):
+                return name
             # check super class
-            return self._get_visitor(node_class.__base__)
+            node_class = node_class.__base__
+        return "generic_visit"
 
     def visit_ScheduleBlock(self, node: ScheduleBlock):
         """Visit ``ScheduleBlock``. Recursively visit context blocks and overwrite.
@@ -32,6 +32,8 @@ instruction occuring in parallel over multiple signal *channels*.
 """
 
 import abc
+import bisect
+import collections
 import copy
 import functools
 import itertools
@@ -40,6 +42,7 @@ import sys
 from typing import List, Tuple, Iterable, Union, Dict, Callable, Set, Optional, Any
 
 import numpy as np
+import retworkx as rx
 
 from qiskit.circuit.parameter import Parameter
 from qiskit.circuit.parameterexpression import ParameterExpression, ParameterValueType
@@ -153,11 +156,16 @@ class Schedule:
         self._timeslots = {}
         self._children = []
         for sched_pair in schedules:
-            try:
-                time, sched = sched_pair
-            except TypeError:
-                # recreate as sequence starting at 0.
+            if isinstance(sched_pair, (Schedule, Instruction)):
+                # Children given without a start time are inserted at 0. Check for these first
+                # instead of failing to unpack them, which is the common case.
                 time, sched = 0, sched_pair
+            else:
+                try:
+                    time, sched = sched_pair
+                except TypeError:
+                    # recreate as sequence starting at 0.
+                    time, sched = 0, sched_pair
             self._mutable_insert(time, sched)
 
     @classmethod
@@ -227,7 +235,7 @@ class Schedule:
     @property
     def start_time(self) -> int:
         """Starting time of this schedule."""
-        return self.ch_start_time(*self.channels)
+        return self.ch_start_time(*self._timeslots)
 
     @property
     def stop_time(self) -> int:
@@ -258,12 +266,7 @@ class Schedule:
     @property
     def instructions(self) -> Tuple[Tuple[int, Instruction]]:
         """Get the time-ordered instructions from self."""
-
-        def key(time_inst_pair):
-            inst = time_inst_pair[1]
-            return time_inst_pair[0], inst.duration, sorted(chan.name for chan in inst.channels)
-
-        return tuple(sorted(self._instructions(), key=key))
+        return tuple(sorted(self._instructions(), key=_instruction_sort_key))
 
     @property
     def parameters(self) -> Set:
@@ -284,12 +287,10 @@ class Schedule:
         Args:
             *channels: Channels within ``self`` to include.
         """
-        try:
-            chan_intervals = (self._timeslots[chan] for chan in channels if chan in self._timeslots)
-            return min(intervals[0][0] for intervals in chan_intervals)
-        except ValueError:
-            # If there are no instructions over channels
-            return 0
+        # The intervals of each channel are sorted, so the first one starts earliest.
+        # If there are no instructions over channels the start time is 0.
+        timeslots = self._timeslots
+        return min((timeslots[chan][0][0] for chan in channels if chan in timeslots), default=0)
 
     def ch_stop_time(self, *channels: Channel) -> int:
         """Return maximum start time over supplied channels.
@@ -297,12 +298,10 @@ class Schedule:
         Args:
             *channels: Channels within ``self`` to include.
         """
-        try:
-            chan_intervals = (self._timeslots[chan] for chan in channels if chan in self._timeslots)
-            return max(intervals[-1][1] for intervals in chan_intervals)
-        except ValueError:
-            # If there are no instructions over channels
-            return 0
+        # The intervals of each channel are sorted and disjoint, so the last one stops latest.
+        # If there are no instructions over channels the stop time is 0.
+        timeslots = self._timeslots
+        return max((timeslots[chan][-1][1] for chan in channels if chan in timeslots), default=0)
 
     def _instructions(self, time: int = 0):
         """Iterable for flattening Schedule tree.
@@ -315,8 +314,19 @@ class Schedule:
                 :class:`~qiskit.pulse.Instruction`
                 starts at and the flattened :class:`~qiskit.pulse.Instruction` s.
         """
-        for insert_time, child_sched in self.children:
-            yield from child_sched._instructions(time + insert_time)
+        # Walk the tree with an explicit stack rather than recursing through nested generators,
+        # which would resume every enclosing generator frame for each instruction yielded.
+        # Children are pushed in reverse so they are visited in insertion order.
+        stack = [(time + insert_time, child) for insert_time, child in reversed(self._children)]
+        while stack:
+            node_time, node = stack.pop()
+            if isinstance(node, Schedule):
+                stack.extend(
+                    (node_time + insert_time, child)
+                    for insert_time, child in reversed(node._children)
+                )
+            else:
+                yield node_time, node
 
     def shift(self, time: int, name: Optional[str] = None, inplace: bool = False) -> "Schedule":
         """Return a schedule shifted forward by ``time``.
@@ -355,15 +365,19 @@ class Schedule:
         if not isinstance(time, int):
             raise PulseError("Schedule start time must be an integer.")
 
-        timeslots = {}
-        for chan, ch_timeslots in self._timeslots.items():
-            timeslots[chan] = [(ts[0] + time, ts[1] + time) for ts in ch_timeslots]
+        timeslots = {
+            chan: [(t0 + time, t1 + time) for t0, t1 in ch_timeslots]
+            for chan, ch_timeslots in self._timeslots.items()
+        }
 
-        _check_nonnegative_timeslot(timeslots)
+        if time < 0:
+            _check_nonnegative_timeslot(timeslots)
 
         self._duration = self._duration + time
         self._timeslots = timeslots
-        self._children = [(orig_time + time, child) for orig_time, child in self.children]
+        # Rebind rather than update the list in place, as a shallow copy may share it. Iterate
+        # ``self._children`` since ``self.children`` would copy it into a tuple first.
+        self._children = [(orig_time + time, child) for orig_time, child in self._children]
         return self
 
     def insert(
@@ -432,8 +446,9 @@ class Schedule:
             inplace: Perform operation inplace on this schedule. Otherwise
                 return a new ``Schedule``.
         """
-        common_channels = set(self.channels) & set(schedule.channels)
-        time = self.ch_stop_time(*common_channels)
+        # ``ch_stop_time`` only considers the channels present in ``self``, so it can be given the
+        # channels of ``schedule`` directly instead of their intersection with ``self.channels``.
+        time = self.ch_stop_time(*schedule.channels)
         return self.insert(time, schedule, name=name, inplace=inplace)
 
     def filter(
@@ -520,47 +535,123 @@ class Schedule:
         if not np.issubdtype(type(time), np.integer):
             raise PulseError("Schedule start time must be an integer.")
 
+        if isinstance(schedule, Instruction):
+            self._add_instruction_timeslots(time, schedule)
+            return
+
         other_timeslots = _get_timeslots(schedule)
+
+        if time < 0:
+            # The intervals of ``schedule`` are sorted and were validated when they were added,
+            # so only the first one on each channel can start before zero. Check them before
+            # updating the timeslots so that a rejected schedule leaves no intervals behind.
+            _check_nonnegative_timeslot(
+                {
+                    channel: [(intervals[0][0] + time, intervals[0][1] + time)]
+                    for channel, intervals in other_timeslots.items()
+                    if intervals
+                }
+            )
+
+        if time >= self._duration:
+            # Every new interval starts after all existing intervals stop, which is the common
+            # case when building a schedule by appending. The intervals can then be added at the
+            # end of each channel without searching for insertion points. Negative start times
+            # have been rejected above, and ``max`` keeps the duration of the general path for
+            # components with a negative duration, e.g. a shifted empty schedule.
+            self._duration = max(self._duration, time + schedule.duration)
+            for channel, other_intervals in other_timeslots.items():
+                self._timeslots.setdefault(channel, []).extend(
+                    [(t0 + time, t1 + time) for t0, t1 in other_intervals]
+                )
+            return
+
         self._duration = max(self._duration, time + schedule.duration)
 
-        for channel in schedule.channels:
-            if channel not in self._timeslots:
+        # The channels of ``schedule`` are the keys of its timeslots, so iterate those instead of
+        # building ``schedule.channels``.
+        for channel, other_intervals in other_timeslots.items():
+            channel_timeslots = self._timeslots.get(channel)
+            if channel_timeslots is None:
                 if time == 0:
-                    self._timeslots[channel] = copy.copy(other_timeslots[channel])
+                    self._timeslots[channel] = other_intervals[:]
                 else:
                     self._timeslots[channel] = [
-                        (i[0] + time, i[1] + time) for i in other_timeslots[channel]
+                        (t0 + time, t1 + time) for t0, t1 in other_intervals
                     ]
                 continue
 
-            for idx, interval in enumerate(other_timeslots[channel]):
-                if interval[0] + time >= self._timeslots[channel][-1][1]:
+            for idx, interval in enumerate(other_intervals):
+                if interval[0] + time >= channel_timeslots[-1][1]:
                     # Can append the remaining intervals
-                    self._timeslots[channel].extend(
-                        [(i[0] + time, i[1] + time) for i in other_timeslots[channel][idx:]]
+                    channel_timeslots.extend(
+                        [(t0 + time, t1 + time) for t0, t1 in other_intervals[idx:]]
                     )
                     break
 
+                interval = (interval[0] + time, interval[1] + time)
                 try:
-                    interval = (interval[0] + time, interval[1] + time)
-                    index = _find_insertion_index(self._timeslots[channel], interval)
-                    self._timeslots[channel].insert(index, interval)
+                    index = _find_insertion_index(channel_timeslots, interval)
                 except PulseError as ex:
                     raise PulseError(
-                        "Schedule(name='{new}') cannot be inserted into Schedule(name='{old}') at "
-                        "time {time} because its instruction on channel {ch} scheduled from time "
-                        "{t0} to {tf} overlaps with an existing instruction."
-                        "".format(
-                            new=schedule.name or "",
-                            old=self.name or "",
-                            time=time,
-                            ch=channel,
-                            t0=interval[0],
-                            tf=interval[1],
-                        )
+                        self._overlap_message(time, schedule, channel, interval)
                     ) from ex
+                channel_timeslots.insert(index, interval)
 
-        _check_nonnegative_timeslot(self._timeslots)
+    def _add_instruction_timeslots(self, time: int, instruction: Instruction) -> None:
+        """Update all time tracking within this schedule based on the given instruction.
+
+        An instruction occupies one interval on each of its channels, so this avoids building its
+        timeslots and merging them as for a general schedule.
+
+        Args:
+            time: The time to insert the instruction into self.
+            instruction: The instruction to insert into self.
+
+        Raises:
+            PulseError: If timeslots overlap or an invalid start time is provided.
+        """
+        duration = instruction.duration
+        instruction_duration_validation(duration)
+        interval = (time, time + duration)
+        if time < 0:
+            # Check before updating the timeslots so that a rejected instruction leaves no
+            # intervals behind.
+            _check_nonnegative_timeslot({channel: [interval] for channel in instruction.channels})
+        self._duration = max(self._duration, interval[1])
+
+        for channel in instruction.channels:
+            channel_timeslots = self._timeslots.get(channel)
+            if channel_timeslots is None:
+                self._timeslots[channel] = [interval]
+            elif time >= channel_timeslots[-1][1]:
+                channel_timeslots.append(interval)
+            else:
+                try:
+                    index = _find_insertion_index(channel_timeslots, interval)
+                except PulseError as ex:
+                    raise PulseError(
+                        self._overlap_message(time, instruction, channel, interval)
+                    ) from ex
+                channel_timeslots.insert(index, interval)
+
+    def _overlap_message(
+        self, time: int, schedule: "ScheduleComponent", channel: Channel, interval: Interval
+    ) -> str:
+        """Return the error message for ``schedule`` overlapping with ``self`` on ``channel``."""
+        return (
+            "Schedule(name='{new}') cannot be inserted into Schedule(name='{old}') at "
+            "time {time} because its instruction on channel {ch} scheduled from time "
+            "{t0} to {tf} overlaps with an existing instruction."
+            "".format(
+                new=schedule.name or "",
+                old=self.name or "",
+                time=time,
+                ch=channel,
+                t0=interval[0],
+                tf=interval[1],
+            )
+        )
 
     def _remove_timeslots(self, time: int, schedule: "ScheduleComponent"):
         """Delete the timeslots if present for the respective schedule component.
@@ -575,13 +666,15 @@ class Schedule:
         if not isinstance(time, int):
             raise PulseError("Schedule start time must be an integer.")
 
+        other_timeslots = _get_timeslots(schedule)
+        # Iterate ``schedule.channels`` rather than the timeslot keys. An instruction may list a
+        # channel more than once, and records one interval for each occurrence.
         for channel in schedule.channels:
 
             if channel not in self._timeslots:
                 raise PulseError(f"The channel {channel} is not present in the schedule")
 
             channel_timeslots = self._timeslots[channel]
-            other_timeslots = _get_timeslots(schedule)
 
             for interval in other_timeslots[channel]:
                 if channel_timeslots:
@@ -615,8 +708,11 @@ class Schedule:
     def _renew_timeslots(self):
         """Regenerate timeslots based on current instructions."""
         self._timeslots.clear()
+        # The flattened instructions are sorted by start time, so nearly every interval is
+        # appended at the end of its channel. Their start times were validated when they were
+        # inserted, so the instructions skip the generic component dispatch of ``_add_timeslots``.
         for t0, inst in self.instructions:
-            self._add_timeslots(t0, inst)
+            self._add_instruction_timeslots(t0, inst)
 
     def replace(
         self,
@@ -678,18 +774,14 @@ class Schedule:
         """
         from qiskit.pulse.parameter_manager import ParameterManager
 
-        new_children = []
-        new_parameters = ParameterManager()
-
-        for time, child in self.children:
-            if child == old:
-                new_children.append((time, new))
-                new_parameters.update_parameter_table(new)
-            else:
-                new_children.append((time, child))
-                new_parameters.update_parameter_table(child)
+        new_children = [(time, new if child == old else child) for time, child in self._children]
 
         if inplace:
+            # A new schedule builds its own parameter table while the children are inserted, so
+            # the table only needs to be collected here when modifying this schedule.
+            new_parameters = ParameterManager()
+            for _, child in new_children:
+                new_parameters.update_parameter_table(child)
             self._children = new_children
             self._parameter_manager = new_parameters
             self._renew_timeslots()
@@ -742,7 +834,8 @@ class Schedule:
 
     def __len__(self) -> int:
         """Return number of instructions in the schedule."""
-        return len(self.instructions)
+        # Counting does not need the time ordering of ``self.instructions``, so skip the sort.
+        return sum(1 for _ in self._instructions())
 
     def __add__(self, other: "ScheduleComponent") -> "Schedule":
         """Return a new schedule with ``other`` inserted within ``self`` at ``start_time``."""
@@ -777,23 +870,29 @@ class Schedule:
             return False
 
         # 1. channel check
-        if set(self.channels) != set(other.channels):
+        # The timeslot keys already form a set-like view of the channels of ``self``.
+        if self._timeslots.keys() != set(other.channels):
             return False
 
+        # Both instruction lists are flattened and sorted on access, so only build them once.
+        self_instructions = self.instructions
+        other_instructions = other.instructions
+
         # 2. size check
-        if len(self.instructions) != len(other.instructions):
+        if len(self_instructions) != len(other_instructions):
             return False
 
         # 3. instruction check
         return all(
             self_inst == other_inst
-            for self_inst, other_inst in zip(self.instructions, other.instructions)
+            for self_inst, other_inst in zip(self_instructions, other_instructions)
         )
 
     def __repr__(self) -> str:
-        name = format(self._name) if self._name else ""
-        instructions = ", ".join([repr(instr) for instr in self.instructions[:50]])
-        if len(self.instructions) > 25:
+        name = self._name or ""
+        all_instructions = self.instructions
+        instructions = ", ".join([repr(instr) for instr in all_instructions[:50]])
+        if len(all_instructions) > 25:
             instructions += ", ..."
         return f'{self.__class__.__name__}({instructions}, name="{name}")'
 
@@ -877,6 +976,15 @@ class ScheduleBlock:
     functionality with ``Schedule`` representation.
     """
 
+    __slots__ = (
+        "_name",
+        "_parameter_manager",
+        "_metadata",
+        "_alignment_context",
+        "_blocks",
+        "__weakref__",
+    )
+
     # Prefix to use for auto naming.
     prefix = "block"
 
@@ -992,7 +1100,7 @@ class ScheduleBlock:
                 return False
 
         # check duration assignment
-        for block in self.blocks:
+        for block in self._blocks:
             if isinstance(block, ScheduleBlock):
                 if not block.is_schedulable():
                     return False
@@ -1010,11 +1118,14 @@ class ScheduleBlock:
     @property
     def channels(self) -> Tuple[Channel]:
         """Returns channels that this schedule clock uses."""
+        return tuple(self._channel_set())
+
+    def _channel_set(self) -> Set[Channel]:
+        """Return the set of channels used by the child blocks."""
         chans = set()
-        for block in self.blocks:
-            for chan in block.channels:
-                chans.add(chan)
-        return tuple(chans)
+        for block in self._blocks:
+            chans.update(block.channels)
+        return chans
 
     @property
     @_require_schedule_conversion
@@ -1201,9 +1312,13 @@ class ScheduleBlock:
             self._parameter_manager = new_parameters
             return self
         else:
-            ret_block = copy.deepcopy(self)
+            # The new blocks and parameter table are already built above, so deep copying the
+            # existing blocks of ``self`` only to discard them is avoided.
+            ret_block = copy.copy(self)
             ret_block._blocks = new_blocks
             ret_block._parameter_manager = new_parameters
+            ret_block._metadata = copy.deepcopy(self._metadata)
+            ret_block._alignment_context = copy.deepcopy(self._alignment_context)
             return ret_block
 
     def is_parameterized(self) -> bool:
@@ -1243,7 +1358,26 @@ class ScheduleBlock:
 
     def __len__(self) -> int:
         """Return number of instructions in the schedule."""
-        return len(self.blocks)
+        return len(self._blocks)
+
+    def __getstate__(self):
+        # Pickle protocols 0 and 1 require an explicit state for classes with ``__slots__``.
+        return (
+            self._name,
+            self._parameter_manager,
+            self._metadata,
+            self._alignment_context,
+            self._blocks,
+        )
+
+    def __setstate__(self, state):
+        (
+            self._name,
+            self._parameter_manager,
+            self._metadata,
+            self._alignment_context,
+            self._blocks,
+        ) = state
 
     def __eq__(self, other: "ScheduleBlock") -> bool:
         """Test if two ScheduleBlocks are equal.
@@ -1272,16 +1406,30 @@ class ScheduleBlock:
         if self.alignment_context != other.alignment_context:
             return False
 
-        # 2. channel check
-        if set(self.channels) != set(other.channels):
+        # 2. size check
+        # This only compares the number of child blocks, so check it before collecting the
+        # channels of the whole block tree.
+        if len(self._blocks) != len(other._blocks):
+            return False
+
+        # 3. channel check
+        if self._channel_set() != other._channel_set():
             return False
 
-        # 3. size check
-        if len(self) != len(other):
+        # 4. child channel check
+        # The DAG match pairs every child with an equal child, and equal children act on the
+        # same channels. Comparing these multisets rejects most unequal blocks cheaply.
+        if collections.Counter(
+            frozenset(block.channels) for block in self._blocks
+        ) != collections.Counter(frozenset(block.channels) for block in other._blocks):
             return False
 
-        # 4. instruction check
-        import retworkx as rx
+        # 5. instruction check
+        if self.alignment_context.is_sequential:
+            # A sequential context is converted into a chain DAG, whose only isomorphism keeps
+            # the instruction order. Compare the children in order instead of building the DAGs.
+            return all(x == y for x, y in zip(self._blocks, other._blocks))
+
         from qiskit.pulse.transforms import block_to_dag
 
         return rx.is_isomorphic_node_match(
@@ -1289,9 +1437,9 @@ class ScheduleBlock:
         )
 
     def __repr__(self) -> str:
-        name = format(self._name) if self._name else ""
-        blocks = ", ".join([repr(instr) for instr in self.blocks[:50]])
-        if len(self.blocks) > 25:
+        name = self._name or ""
+        blocks = ", ".join([repr(instr) for instr in self._blocks[:50]])
+        if len(self._blocks) > 25:
             blocks += ", ..."
         return '{}({}, name="{}", transform={})'.format(
             self.__class__.__name__, blocks, name, repr(self.alignment_context)
@@ -1313,12 +1461,8 @@ def _common_method(*classes):
     """
 
     def decorator(method):
-        @functools.wraps(method)
-        def wrapper(*args, **kwargs):
-            return method(*args, **kwargs)
-
         for cls in classes:
-            setattr(cls, method.__name__, wrapper)
+            setattr(cls, method.__name__, method)
         return method
 
     return decorator
@@ -1396,6 +1540,12 @@ def draw(
     )
 
 
+def _instruction_sort_key(time_inst_pair: Tuple[int, Instruction]) -> Tuple[int, int, List[str]]:
+    """Return the key ordering timed instructions by time, duration and channel names."""
+    inst = time_inst_pair[1]
+    return time_inst_pair[0], inst.duration, sorted(chan.name for chan in inst.channels)
+
+
 def _interval_index(intervals: List[Interval], interval: Interval) -> int:
     """Find the index of an interval.
 
@@ -1409,36 +1559,12 @@ def _interval_index(intervals: List[Interval], interval: Interval) -> int:
     Raises:
         PulseError: If the interval does not exist.
     """
-    index = _locate_interval_index(intervals, interval)
-    found_interval = intervals[index]
-    if found_interval != interval:
+    index = bisect.bisect_left(intervals, interval)
+    if index == len(intervals) or intervals[index] != interval:
         raise PulseError(f"The interval: {interval} does not exist in intervals: {intervals}")
     return index
 
 
-def _locate_interval_index(intervals: List[Interval], interval: Interval, index: int = 0) -> int:
-    """Using binary search on start times, find an interval.
-
-    Args:
-        intervals: A sorted list of non-overlapping Intervals.
-        interval: The interval for which the index into intervals will be found.
-        index: A running tally of the index, for recursion. The user should not pass a value.
-
-    Returns:
-        The index into intervals that new_interval would be inserted to maintain
-        a sorted list of intervals.
-    """
-    if not intervals or len(intervals) == 1:
-        return index
-
-    mid_idx = len(intervals) // 2
-    mid = intervals[mid_idx]
-    if interval[1] <= mid[0] and (interval != mid):
-        return _locate_interval_index(intervals[:mid_idx], interval, index=index)
-    else:
-        return _locate_interval_index(intervals[mid_idx:], interval, index=index + mid_idx)
-
-
 def _find_insertion_index(intervals: List[Interval], new_interval: Interval) -> int:
     """Using binary search on start times, return the index into `intervals` where the new interval
     belongs, or raise an error if the new interval overlaps with any existing ones.
@@ -1451,26 +1577,19 @@ def _find_insertion_index(intervals: List[Interval], new_interval: Interval) ->
     Raises:
         PulseError: If new_interval overlaps with the given intervals.
     """
-    index = _locate_interval_index(intervals, new_interval)
-    if index < len(intervals):
-        if _overlaps(intervals[index], new_interval):
-            raise PulseError("New interval overlaps with existing.")
-        return index if new_interval[1] <= intervals[index][0] else index + 1
+    index = bisect.bisect_left(intervals, new_interval)
+    # The existing intervals are disjoint and sorted, so only the neighbors of the insertion
+    # point can overlap with the new interval. Stop times are exclusive, so intervals may touch,
+    # but an interval of duration 0 lying strictly within another one overlaps with it. As the
+    # previous neighbor sorts before and the next one after ``new_interval``, this reduces to a
+    # single comparison for each.
+    if index > 0 and intervals[index - 1][1] > new_interval[0]:
+        raise PulseError("New interval overlaps with existing.")
+    if index < len(intervals) and intervals[index][0] < new_interval[1]:
+        raise PulseError("New interval overlaps with existing.")
     return index
 
 
-def _overlaps(first: Interval, second: Interval) -> bool:
-    """Return True iff first and second overlap.
-    Note: first.stop may equal second.start, since Interval stop times are exclusive.
-    """
-    if first[0] == second[0] == second[1]:
-        # They fail to overlap if one of the intervals has duration 0
-        return False
-    if first[0] > second[0]:
-        first, second = second, first
-    return second[0] < first[1]
-
-
 def _check_nonnegative_timeslot(timeslots: TimeSlots):
     """Test that a channel has no negative timeslots.
 
@@ -23,6 +23,7 @@ from qiskit.assembler.disassemble import disassemble
 from qiskit.assembler.run_config import RunConfig
 from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.circuit import Gate, Instruction, Parameter
+from qiskit.circuit.exceptions import CircuitError
 
 from qiskit.circuit.library import RXGate
 from qiskit.pulse.transforms import target_qobj_transform
@@ -104,6 +105,36 @@ class TestQuantumCircuitDisassembler(QiskitTestCase):
             self.assertIn(circuit, [circ0, circ1])
         self.assertEqual({}, headers)
 
+    def test_disassemble_multiple_circuits_same_registers(self):
+        """Test disassembling multiple circuits that share the same registers."""
+        qr = QuantumRegister(2, name="q")
+        cr = ClassicalRegister(2, name="c")
+        circ0 = QuantumCircuit(qr, cr, name="circ0")
+        circ0.h(qr[0])
+        circ0.measure(qr, cr)
+        circ1 = QuantumCircuit(qr, cr, name="circ1")
+        circ1.x(qr[1])
+        circ1.cx(qr[1], qr[0])
+        circ1.measure(qr, cr)
+
+        qobj = assemble([circ0, circ1])
+        circuits, _, _ = disassemble(qobj)
+        self.assertEqual(circuits, [circ0, circ1])
+
+        circuits[0].x(0)
+        self.assertEqual(len(circuits[0].data), 4)
+        self.assertEqual(circuits[1], circ1)
+
+    def test_disassemble_duplicate_qubits_raises(self):
+        """Test disassembling an instruction with duplicate qubit arguments raises."""
+        circ = QuantumCircuit(2, name="circ")
+        circ.cx(0, 1)
+
+        qobj = assemble(circ)
+        qobj.experiments[0].instructions[0].qubits = [0, 0]
+        with self.assertRaises(CircuitError):
+            disassemble(qobj)
+
     def test_disassemble_no_run_config(self):
         """Test disassembling with no run_config, relying on default."""
         qr = QuantumRegister(2, name="q")
@@ -400,6 +431,33 @@ class TestQuantumCircuitDisassembler(QiskitTestCase):
 
         self.assertCircuitCalibrationsEqual(circuits, output_circuits)
 
+    def test_multi_circuit_common_calibrations_not_shared(self):
+        """Test that common calibrations are copied into each disassembled circuit."""
+        with pulse.build() as sched:
+            pulse.play(pulse.library.Drag(1, 0.15, 4, 2), pulse.DriveChannel(0))
+
+        qc_0 = QuantumCircuit(2)
+        qc_0.append(RXGate(np.pi), [1])
+        qc_0.add_calibration(RXGate(np.pi), [1], sched)
+
+        qc_1 = QuantumCircuit(2)
+        qc_1.append(RXGate(np.pi), [1])
+        qc_1.add_calibration(RXGate(np.pi), [1], sched)
+
+        qobj = assemble([qc_0, qc_1], FakeOpenPulse2Q())
+        output_circuits, _, _ = disassemble(qobj)
+        output_circuits[0].add_calibration(RXGate(np.pi), [0], sched)
+
+        self.assertEqual(len(output_circuits[0].calibrations["rx"]), 2)
+        self.assertEqual(len(output_circuits[1].calibrations["rx"]), 1)
+
+        ((config, cal_1),) = output_circuits[1].calibrations["rx"].items()
+        cal_0 = output_circuits[0].calibrations["rx"][config]
+        self.assertIsNot(cal_0, cal_1)
+
+        cal_0.insert(cal_0.duration, pulse.Delay(10, pulse.DriveChannel(0)), inplace=True)
+        self.assertEqual(cal_1.duration, cal_0.duration - 10)
+
     def test_single_circuit_delay_calibrations(self):
         """Test that disassembler parses delay instruction back to delay gate."""
         qc = QuantumCircuit(2)
@@ -13,7 +13,10 @@
 # pylint: disable=invalid-name
 
 """Test cases for the pulse schedule block."""
+import pickle
 import unittest
+import weakref
+
 from qiskit import pulse, circuit
 from qiskit.pulse import transforms
 from qiskit.pulse.exceptions import PulseError
@@ -359,6 +362,24 @@ class TestBlockOperation(BaseTestBlock):
             block = block.append(pulse.Delay(10, self.d0))
             self.assertEqual(len(block), j)
 
+    def test_pickle(self):
+        """Test a block round-trips through every pickle protocol."""
+        block = pulse.ScheduleBlock(name="test", metadata={"key": "value"})
+        block += pulse.Play(self.test_waveform0, self.d0)
+        block += pulse.Delay(10, self.d1)
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                restored = pickle.loads(pickle.dumps(block, protocol=protocol))
+                self.assertEqual(restored, block)
+                self.assertEqual(restored.name, "test")
+                self.assertEqual(restored.metadata, {"key": "value"})
+
+    def test_weakref(self):
+        """Test a block can be weakly referenced."""
+        block = pulse.ScheduleBlock()
+        self.assertIs(weakref.ref(block)(), block)
+
     def test_inherit_from(self):
         """Test creating schedule with another schedule."""
         ref_metadata = {"test": "value"}
@@ -423,6 +444,22 @@ class TestBlockEquality(BaseTestBlock):
 
         self.assertNotEqual(block1, block2)
 
+    def test_different_channels_per_child(self):
+        """Test equality is False if children act on different channels."""
+        block1 = pulse.ScheduleBlock()
+        block1 += pulse.Delay(10, self.d0)
+        block1 += pulse.Delay(10, self.d1)
+
+        nested = pulse.ScheduleBlock()
+        nested += pulse.Delay(10, self.d0)
+        nested += pulse.Delay(10, self.d1)
+
+        block2 = pulse.ScheduleBlock()
+        block2 += nested
+        block2 += pulse.Delay(10, self.d0)
+
+        self.assertNotEqual(block1, block2)
+
     def test_instruction_out_of_order_left(self):
         """Test equality is True if two blocks have instructions in different order."""
         block1 = pulse.ScheduleBlock(alignment_context=self.left_context)
@@ -11,6 +11,7 @@
 # that they have been altered from the originals.
 
 """Test cases for the pulse schedule."""
+import copy
 import unittest
 from unittest.mock import patch
 
@@ -44,7 +45,8 @@ from qiskit.pulse.channels import (
     MeasureChannel,
 )
 from qiskit.pulse.exceptions import PulseError
-from qiskit.pulse.schedule import Schedule, _overlaps, _find_insertion_index
+from qiskit.pulse.instructions import RelativeBarrier
+from qiskit.pulse.schedule import Schedule, _find_insertion_index
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeOpenPulse2Q
 
@@ -362,6 +364,23 @@ class TestScheduleBuilding(BaseTestSchedule):
         with self.assertRaises(PulseError):
             sched.shift(-10)
 
+    def test_negative_insert_time_leaves_no_timeslots(self):
+        """Test that an insert rejected for a negative time does not corrupt the timeslots."""
+        sched = Schedule()
+        sched += Delay(10, DriveChannel(0))
+
+        sub_sched = Schedule()
+        sub_sched += Delay(2, ControlChannel(0))
+
+        with self.assertRaises(PulseError):
+            sched.insert(-1, Delay(2, ControlChannel(0)), inplace=True)
+        with self.assertRaises(PulseError):
+            sched.insert(-1, sub_sched, inplace=True)
+
+        sched.insert(5, Delay(2, ControlChannel(0)), inplace=True)
+        self.assertEqual(sched.timeslots[ControlChannel(0)], [(5, 7)])
+        self.assertEqual(sched.duration, 10)
+
     def test_shift_float_time_raises(self):
         """Test that a floating time will raise an error with shift."""
         sched = Schedule()
@@ -383,6 +402,20 @@ class TestScheduleBuilding(BaseTestSchedule):
         shifted_sched = reference_sched.shift(10).shift(-10)
         self.assertEqual(shifted_sched, reference_sched)
 
+    def test_insert_negative_duration_schedule(self):
+        """Test inserting an empty schedule with a negative duration keeps the duration."""
+        empty = Schedule().shift(-3, inplace=True)
+        self.assertEqual(empty.duration, -3)
+        self.assertEqual(Schedule().insert(0, empty).duration, 0)
+
+    def test_shift_inplace_shallow_copy(self):
+        """Test shifting a shallow copy in place leaves the original schedule intact."""
+        sched = Schedule((0, Delay(10, DriveChannel(0))))
+        copy.copy(sched).shift(5, inplace=True)
+
+        self.assertEqual(sched.instructions[0][0], 0)
+        self.assertEqual(sched.timeslots, {DriveChannel(0): [(0, 10)]})
+
     def test_duration(self):
         """Test schedule.duration."""
         reference_sched = Schedule()
@@ -485,6 +518,15 @@ class TestReplace(BaseTestSchedule):
         sched.replace(old, new, inplace=True)
         self.assertEqual(sched, Schedule(new))
 
+    def test_remove_timeslots_repeated_channel(self):
+        """Test removing the timeslots of an instruction that lists a channel twice."""
+        barrier = RelativeBarrier(DriveChannel(0), DriveChannel(0))
+        sched = Schedule((5, barrier))
+        self.assertEqual(sched.timeslots[DriveChannel(0)], [(5, 5), (5, 5)])
+
+        sched._remove_timeslots(5, barrier)
+        self.assertEqual(sched.timeslots, {})
+
     def test_replace_schedule(self):
         """Test replacement of schedule."""
 
@@ -905,6 +947,20 @@ class TestScheduleEquality(BaseTestSchedule):
             Schedule((1, ShiftPhase(0, DriveChannel(1)))),
         )
 
+    def test_same_time_different_instruction_not_equal(self):
+        """Test that not equal if different instructions occupy the same time."""
+        self.assertNotEqual(
+            Schedule((0, Delay(10, DriveChannel(1)))),
+            Schedule((0, Play(Waveform(np.ones(10)), DriveChannel(1)))),
+        )
+
+    def test_equal_instructions_with_different_timeslots(self):
+        """Test equality of instructions that are equal but record different timeslots."""
+        self.assertEqual(
+            Schedule((5, RelativeBarrier(DriveChannel(0), DriveChannel(0)))),
+            Schedule((5, RelativeBarrier(DriveChannel(0)))),
+        )
+
     def test_single_channel_out_of_order(self):
         """Test that schedule with single channel equal when out of order."""
         instructions = [
@@ -947,31 +1003,32 @@ class TestScheduleEquality(BaseTestSchedule):
 class TestTimingUtils(QiskitTestCase):
     """Test the Schedule helper functions."""
 
-    def test_overlaps(self):
-        """Test the `_overlaps` function."""
+    def test_find_insertion_index_adjacent(self):
+        """Test `_find_insertion_index` with intervals that touch or overlap a single interval."""
         a = (0, 1)
         b = (1, 4)
         c = (2, 3)
         d = (3, 5)
-        self.assertFalse(_overlaps(a, b))
-        self.assertFalse(_overlaps(b, a))
-        self.assertFalse(_overlaps(a, d))
-        self.assertTrue(_overlaps(b, c))
-        self.assertTrue(_overlaps(c, b))
-        self.assertTrue(_overlaps(b, d))
-        self.assertTrue(_overlaps(d, b))
-
-    def test_overlaps_zero_duration(self):
-        """Test the `_overlaps` function for intervals with duration zero."""
+        self.assertEqual(_find_insertion_index([a], b), 1)
+        self.assertEqual(_find_insertion_index([b], a), 0)
+        self.assertEqual(_find_insertion_index([a], d), 1)
+        for existing, new in [(b, c), (c, b), (b, d), (d, b)]:
+            with self.assertRaises(PulseError):
+                _find_insertion_index([existing], new)
+
+    def test_find_insertion_index_zero_duration(self):
+        """Test `_find_insertion_index` for intervals with duration zero."""
         a = 0
         b = 1
-        self.assertFalse(_overlaps((a, a), (a, a)))
-        self.assertFalse(_overlaps((a, a), (a, b)))
-        self.assertFalse(_overlaps((a, b), (a, a)))
-        self.assertFalse(_overlaps((a, b), (b, b)))
-        self.assertFalse(_overlaps((b, b), (a, b)))
-        self.assertTrue(_overlaps((a, a + 2), (a + 1, a + 1)))
-        self.assertTrue(_overlaps((a + 1, a + 1), (a, a + 2)))
+        self.assertEqual(_find_insertion_index([(a, a)], (a, a)), 0)
+        self.assertEqual(_find_insertion_index([(a, a)], (a, b)), 1)
+        self.assertEqual(_find_insertion_index([(a, b)], (a, a)), 0)
+        self.assertEqual(_find_insertion_index([(a, b)], (b, b)), 1)
+        self.assertEqual(_find_insertion_index([(b, b)], (a, b)), 0)
+        with self.assertRaises(PulseError):
+            _find_insertion_index([(a, a + 2)], (a + 1, a + 1))
+        with self.assertRaises(PulseError):
+            _find_insertion_index([(a + 1, a + 1)], (a, a + 2))
 
     def test_find_insertion_index(self):
         """Test the `_find_insertion_index` function."""
@@ -997,7 +1054,7 @@ class TestTimingUtils(QiskitTestCase):
         self.assertEqual(_find_insertion_index(intervals, (73, 81)), 3)
 
     def test_find_insertion_index_when_overlapping(self):
-        """Test that `_find_insertion_index` raises an error when the new_interval _overlaps."""
+        """Test that `_find_insertion_index` raises an error when the new_interval overlaps."""
         intervals = [(10, 20), (44, 55), (60, 61), (80, 1000)]
         with self.assertRaises(PulseError):
             _find_insertion_index(intervals, (60, 62))